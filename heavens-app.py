@@ -1,8 +1,7 @@
 import sys
 import streamlit as st
 from uszipcode import SearchEngine
-from astrology import Stars
-from datetime import datetime
+from astrology import Stars, EXPLAINERS
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
@@ -24,6 +23,11 @@ else:
     setPath(eph_path)
 
 
+@st.cache_resource(max_entries=256)
+def read_chart(bdate, btime, bplacezip):
+    # charts are read-only once built, so identical submissions share one
+    return Stars(bdate, btime, bplacezip)
+
 st.title('Calculate Your Chart :night_with_stars::milky_way:')
 st.subheader('See the makeup of your full zodiac chart')
 
@@ -36,13 +40,12 @@ with st.form("user_zodiac_data"):
     st.caption('optional, approximate is okay')
     submitted = st.form_submit_button("Read Chart")
     if submitted:
-        stars = Stars(bd.strftime(("%Y/%m/%d")), bt, bz)
-        today = Stars(datetime.now().strftime("%Y/%m/%d"), datetime.now().time().strftime("%H:%M:%S"), '01776')
+        stars = read_chart(bd.strftime(("%Y/%m/%d")), bt, bz)
     else:
         st.stop()
 
 df = pd.DataFrame.from_dict(stars.p, orient='index')
-df['is_Retrograde'] = df['isRetrograde'].apply(lambda x: 2 if x else 1) # if 
+df['is_Retrograde'] = df['isRetrograde'].astype(bool) + 1 # 2 retrograde, 1 direct; houses have no flag and stay truthy like before
 pivot_table = df.pivot_table(index='sign', columns='name', values='is_Retrograde', fill_value=None, sort=False)
 # Heatmap: Planetary Movement
 fig = plt.figure(figsize=(10, 6))
@@ -56,14 +59,8 @@ st.subheader("Planetary Movement (Direct/Retrograde)")
 st.pyplot(fig)
 st.caption("Green: direct movement; Purple: retrograde movement.")
 
-st.divider()
-st.subheader('Understanding Sun in {} :{}:'.format(stars.p.get('sun').get('sign').capitalize(), stars.p.get('sun').get('sign').lower()))
-st.markdown(stars.sun_qualities[stars.sun_qualities.Quality=='Sun Sign Description'][stars.p.get('sun').get('sign')].values[0])
-
-st.divider()
-st.subheader('Understanding Moon in {} :{}:'.format(stars.p.get('moon').get('sign').capitalize(), stars.p.get('moon').get('sign').lower()))
-st.markdown(stars.sun_qualities[stars.sun_qualities.Quality=='Moon Sign Description'][stars.p.get('moon').get('sign')].values[0])
-
-st.divider()
-st.subheader('Understanding Rising Sign in {} :{}:'.format(stars.p.get('ascendant').get('sign').capitalize(), stars.p.get('ascendant').get('sign').lower()))
-st.markdown(stars.sun_qualities[stars.sun_qualities.Quality=='Rising Sign Description'][stars.p.get('ascendant').get('sign')].values[0])
\ No newline at end of file
+for explainer in EXPLAINERS.values():
+    sign = stars.p.get(explainer.point).get('sign')
+    st.divider()
+    st.subheader('Understanding {} in {} :{}:'.format(explainer.title, sign.capitalize(), sign.lower()))
+    st.markdown(stars.sun_qualities.at[explainer.quality, sign])